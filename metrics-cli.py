@@ -3,55 +3,138 @@
 CLI script for local development and testing of the metrics exporter.
 """
 
-import argparse
 import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+
+# The option set is tiny and fixed, so it's parsed by hand: argparse's import and
+# parser construction would dominate a one-shot --dry-run.
+USAGE = """\
+usage: metrics-cli.py [-h] [--obs-endpoint OBS_ENDPOINT] [--vllm-port VLLM_PORT]
+                      [--interval INTERVAL] [--gpu-type GPU_TYPE] [--dry-run]
+                      [--log-level {DEBUG,INFO,WARNING,ERROR}]
+
+LLM Serving Lab Metrics Exporter
+
+options:
+  -h, --help            show this help message and exit
+  --obs-endpoint OBS_ENDPOINT
+                        OBS OTLP endpoint (default: from OBS_OTLP_ENDPOINT env var)
+  --vllm-port VLLM_PORT
+                        vLLM server port (default: 8000)
+  --interval INTERVAL   Collection interval in seconds (default: 30)
+  --gpu-type GPU_TYPE   GPU type identifier (default: development)
+  --dry-run             Collect metrics once and print, don't start continuous export
+  --log-level {DEBUG,INFO,WARNING,ERROR}
+                        Logging level (default: INFO)"""
+
+# --log-level choices -> numeric logging levels (logging.DEBUG, ...), resolved
+# without attribute lookups on the logging module
+LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+# Options taking a value: flag -> (attribute, type)
+VALUE_OPTIONS = {
+    "--obs-endpoint": ("obs_endpoint", str),
+    "--vllm-port": ("vllm_port", int),
+    "--interval": ("interval", int),
+    "--gpu-type": ("gpu_type", str),
+    "--log-level": ("log_level", str),
+}
+
+# All long options, for argparse-style abbreviations (--log -> --log-level)
+LONG_OPTIONS = ("--help", "--dry-run", *VALUE_OPTIONS)
+
+
+def usage_error(message: str):
+    """Print usage and an error message to stderr, then exit with status 2."""
+    print(USAGE.split("\n\n", 1)[0], file=sys.stderr)
+    print(f"metrics-cli.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def resolve_option(flag: str) -> str:
+    """Expand a unique prefix of a long option to its full name, like argparse.
+
+    Exact names and anything that isn't a long option are returned unchanged.
+    """
+    if flag in LONG_OPTIONS or not flag.startswith("--") or flag == "--":
+        return flag
+    matches = [option for option in LONG_OPTIONS if option.startswith(flag)]
+    if len(matches) > 1:
+        usage_error(f"ambiguous option: {flag} could match {', '.join(matches)}")
+    return matches[0] if matches else flag
+
+
+def parse_args(argv: list[str]) -> SimpleNamespace:
+    """Parse command line arguments.
+
+    Accepts ``--opt value`` and ``--opt=value``, with long options abbreviated
+    to any unique prefix.
+    """
+    args = SimpleNamespace(
+        obs_endpoint=None,
+        vllm_port=8000,
+        interval=30,
+        gpu_type="development",
+        dry_run=False,
+        log_level="INFO",
+    )
 
-# Add src to path for local development
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+    remaining = iter(argv)
+    for arg in remaining:
+        flag, has_value, value = arg.partition("=")
+        flag = resolve_option(flag)
+        if not has_value:
+            if flag in ("-h", "--help"):
+                print(USAGE)
+                sys.exit(0)
+            if flag == "--dry-run":
+                args.dry_run = True
+                continue
+
+        if flag not in VALUE_OPTIONS:
+            usage_error(f"unrecognized arguments: {arg}")
+        if not has_value:
+            value = next(remaining, None)
+            if value is None:
+                usage_error(f"argument {flag}: expected one argument")
+
+        attr, type_ = VALUE_OPTIONS[flag]
+        try:
+            setattr(args, attr, type_(value))
+        except ValueError:
+            usage_error(f"argument {flag}: invalid {type_.__name__} value: {value!r}")
+
+    if args.log_level not in LOG_LEVELS:
+        choices = ", ".join(repr(c) for c in LOG_LEVELS)
+        usage_error(
+            f"argument --log-level: invalid choice: {args.log_level!r} "
+            f"(choose from {choices})"
+        )
+
+    return args
+
+
+def add_src_to_path():
+    """Make the src/ modules importable for local development.
+
+    Prepended so the local modules take precedence over an installed copy of
+    the same package; skipped when already present to avoid duplicate entries.
+    """
+    src_path = str(Path(__file__).parent / "src")
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
 
 
 def main():
-    parser = argparse.ArgumentParser(description="LLM Serving Lab Metrics Exporter")
-    parser.add_argument(
-        "--obs-endpoint",
-        help="OBS OTLP endpoint (default: from OBS_OTLP_ENDPOINT env var)",
-    )
-    parser.add_argument(
-        "--vllm-port", type=int, default=8000, help="vLLM server port (default: 8000)"
-    )
-    parser.add_argument(
-        "--interval",
-        type=int,
-        default=30,
-        help="Collection interval in seconds (default: 30)",
-    )
-    parser.add_argument(
-        "--gpu-type",
-        default="development",
-        help="GPU type identifier (default: development)",
-    )
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Collect metrics once and print, don't start continuous export",
-    )
-    parser.add_argument(
-        "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
-        default="INFO",
-        help="Logging level (default: INFO)",
-    )
-
-    args = parser.parse_args()
+    args = parse_args(sys.argv[1:])
 
     # Setup logging
     import logging
 
     logging.basicConfig(
-        level=getattr(logging, args.log_level),
+        level=LOG_LEVELS[args.log_level],
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
@@ -62,10 +145,10 @@ def main():
     os.environ["METRICS_INTERVAL"] = str(args.interval)
     os.environ["GPU_TYPE"] = args.gpu_type
 
+    # The exporter import pulls in the OTel SDK, protobuf and grpc, so each branch
+    # imports it only once its own checks have passed
+    add_src_to_path()
     try:
-        # Import here to avoid issues with sys.path manipulation
-        from monitoring.metrics_exporter import create_exporter_from_env
-
         if args.dry_run:
             # Dry run mode - collect metrics once and print
             print("=== Dry run mode - collecting metrics once ===")
@@ -74,6 +157,8 @@ def main():
                 # For dry run, we can use a dummy endpoint
                 os.environ["OBS_OTLP_ENDPOINT"] = "dummy:4317"
 
+            from monitoring.metrics_exporter import create_exporter_from_env
+
             exporter = create_exporter_from_env()
             metrics = exporter.collect_metrics()
 
@@ -91,6 +176,8 @@ def main():
                 )
                 sys.exit(1)
 
+            from monitoring.metrics_exporter import create_exporter_from_env
+
             exporter = create_exporter_from_env()
             exporter.run()
 
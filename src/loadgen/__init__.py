@@ -1,6 +1,32 @@
 """Load generation utilities for LLM serving experiments."""
 
-from .config import LoadTestConfig
-from .load_generator_v1 import LoadGeneratorV1, LoadTestResults, RequestResult
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import LoadTestConfig
+    from .load_generator_v1 import LoadGeneratorV1, LoadTestResults, RequestResult
 
 __all__ = ["LoadGeneratorV1", "LoadTestConfig", "LoadTestResults", "RequestResult"]
+
+# Public name -> submodule; resolved on first access (PEP 562) so importing the
+# package doesn't pull in the HTTP client stack.
+_LAZY_ATTRS = {
+    "LoadTestConfig": ".config",
+    "LoadGeneratorV1": ".load_generator_v1",
+    "LoadTestResults": ".load_generator_v1",
+    "RequestResult": ".load_generator_v1",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -3,132 +3,160 @@ Configuration classes for LLM load testing.
 """
 
 import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
 from typing import Any
 
-from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
+@dataclass(slots=True, frozen=True)
+class _EnvDefaults:
+    """Config defaults parsed from environment variables."""
+
+    url: str
+    api_key: str | None
+    model_name: str
+    max_tokens: int
+    total_requests: int
+    concurrency: int
+    stream: bool
+    target_qps: float | None
+    num_workers: int
+
+
+def _snapshot_env() -> _EnvDefaults:
+    """Read and parse all env-sourced config defaults in one pass."""
+    # Full URL takes precedence (load generator style); otherwise build it from
+    # components (compatible with ansible env.j2 on the GPU VM)
+    url = os.getenv("VLLM_URL") or (
+        f"http://{os.getenv('VLLM_HOST', 'localhost')}:"
+        f"{os.getenv('VLLM_PORT', '8000')}/v1/chat/completions"
+    )
+    return _EnvDefaults(
+        url=url,
+        api_key=os.getenv("VLLM_API_KEY"),
+        model_name=os.getenv(
+            "MODEL_NAME", "mistralai/Mistral-7B-Instruct-v0.3"
+        ).strip(),
+        max_tokens=int(os.getenv("MAX_TOKENS", "128")),
+        total_requests=int(os.getenv("LOAD_REQUESTS", "50")),
+        concurrency=int(os.getenv("LOAD_CONCURRENCY", "1")),
+        stream=os.getenv("LOAD_STREAM", "false").lower() == "true",
+        target_qps=float(qps) if (qps := os.getenv("LOAD_TARGET_QPS")) else None,
+        num_workers=int(os.getenv("LOAD_WORKERS", "1")),
+    )
 
-def _build_vllm_url() -> str:
-    """Build vLLM URL from environment variables, compatible with GPU setup."""
-    # Check for full URL first (load generator style)
-    if url := os.getenv("VLLM_URL"):
-        return url
 
-    # Build from components (compatible with ansible env.j2)
-    host = os.getenv("VLLM_HOST", "localhost")
-    port = os.getenv("VLLM_PORT", "8000")
-    return f"http://{host}:{port}/v1/chat/completions"
+# Taken once at import; use LoadTestConfig.from_env() to pick up later changes
+_ENV = _snapshot_env()
 
 
-class LoadTestConfig(BaseModel):
-    """Configuration for LLM load testing."""
+@dataclass(slots=True, frozen=True)
+class LoadTestConfig:
+    """Configuration for LLM load testing.
+
+    Plain dataclass with explicit checks in ``__post_init__``: the validation is
+    a handful of scalar comparisons, so pydantic's schema build and per-instance
+    validation overhead buy nothing here.
+    """
 
     # Connection settings (from GPU VM)
-    url: str = Field(
-        default_factory=lambda: _build_vllm_url(),
-        description="API endpoint URL (from VLLM_HOST/VLLM_PORT or VLLM_URL)",
-    )
-    api_key: str | None = Field(
-        default_factory=lambda: os.getenv("VLLM_API_KEY"),
-        description="API authentication key (from GPU VM)",
-    )
-    timeout: float = Field(
-        default=60.0, description="Request timeout in seconds", gt=0, le=300.0
-    )
+    # API endpoint URL (from VLLM_HOST/VLLM_PORT or VLLM_URL)
+    url: str = _ENV.url
+    # API authentication key (from GPU VM)
+    api_key: str | None = _ENV.api_key
+    # Request timeout in seconds (also bounds the wait between stream chunks)
+    timeout: float = 60.0
+    # Abort a streaming response whose body grows past this many bytes
+    max_response_bytes: int = 8 * 1024 * 1024
 
     # Model settings (from GPU VM)
-    model_name: str = Field(
-        default_factory=lambda: os.getenv(
-            "MODEL_NAME", "mistralai/Mistral-7B-Instruct-v0.3"
-        ),
-        description="LLM model name (from GPU VM)",
-    )
-    max_tokens: int = Field(
-        default_factory=lambda: int(os.getenv("MAX_TOKENS", "128")),
-        description="Max tokens to generate per request",
-        ge=1,
-        le=4096,  # Reasonable upper limit
-    )
-    temperature: float = Field(
-        default=0.0, description="Sampling temperature", ge=0.0, le=2.0
-    )
+    model_name: str = _ENV.model_name
+    # Max tokens to generate per request
+    max_tokens: int = _ENV.max_tokens
+    # Sampling temperature
+    temperature: float = 0.0
 
     # Load test settings (load generator specific)
-    total_requests: int = Field(
-        default_factory=lambda: int(os.getenv("LOAD_REQUESTS", "50")),
-        description="Total requests to send",
-        ge=1,
-    )
-    concurrency: int = Field(
-        default_factory=lambda: int(os.getenv("LOAD_CONCURRENCY", "1")),
-        description="Concurrent requests",
-        ge=1,
-    )
-    warmup_count: int = Field(default=5, description="Warmup requests count", ge=0)
-    stream: bool = Field(
-        default_factory=lambda: os.getenv("LOAD_STREAM", "false").lower() == "true",
-        description="Enable streaming mode for TTFT measurement",
-    )
-
-    @field_validator("url")
-    @classmethod
-    def validate_url(cls, v: str) -> str:
-        """Validate URL format."""
-        if not v.startswith(("http://", "https://")):
+    total_requests: int = _ENV.total_requests
+    concurrency: int = _ENV.concurrency
+    warmup_count: int = 5
+    # Enable streaming mode for TTFT measurement
+    stream: bool = _ENV.stream
+    # Open-loop arrival rate in requests/sec (default: send whenever a slot frees)
+    target_qps: float | None = _ENV.target_qps
+    # Generator processes, each with its own event loop (0 = half the CPUs)
+    num_workers: int = _ENV.num_workers
+    # Max in-flight requests per worker process (default: concurrency split evenly)
+    worker_max_concurrency: int | None = None
+
+    # Derived in __post_init__; the config is immutable so these never go stale
+    _payload_template: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+    _summary: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Validate and normalize fields."""
+        if not self.url.startswith(("http://", "https://")):
             raise ValueError("URL must start with http:// or https://")
-        return v
 
-    @field_validator("model_name")
-    @classmethod
-    def validate_model_name(cls, v: str) -> str:
-        """Validate model name format."""
-        if not v or len(v.strip()) == 0:
+        # Env defaults arrive pre-stripped, so normally there is nothing to write
+        model_name = self.model_name.strip()
+        if not model_name:
             raise ValueError("Model name cannot be empty")
-        return v.strip()
+        if model_name != self.model_name:
+            object.__setattr__(self, "model_name", model_name)
+
+        # Range checks
+        if not 0 < self.timeout <= 300.0:
+            raise ValueError("timeout must be in (0, 300] seconds")
+        if self.max_response_bytes < 1:
+            raise ValueError("max_response_bytes must be >= 1")
+        if not 1 <= self.max_tokens <= 4096:  # Reasonable upper limit
+            raise ValueError("max_tokens must be between 1 and 4096")
+        if not 0.0 <= self.temperature <= 2.0:
+            raise ValueError("temperature must be between 0.0 and 2.0")
+        if self.total_requests < 1:
+            raise ValueError("total_requests must be >= 1")
+        if self.concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if self.warmup_count < 0:
+            raise ValueError("warmup_count must be >= 0")
+        if self.target_qps is not None and self.target_qps <= 0:
+            raise ValueError("target_qps must be > 0")
+        if self.num_workers < 0:
+            raise ValueError("num_workers must be >= 0")
+        if self.worker_max_concurrency is not None and self.worker_max_concurrency < 1:
+            raise ValueError("worker_max_concurrency must be >= 1")
+
+        # Ensure concurrency doesn't exceed total requests
+        if self.concurrency > self.total_requests:
+            object.__setattr__(self, "concurrency", self.total_requests)
+
+        # Resolve auto worker count; a worker without a request slot is useless
+        num_workers = self.num_workers or max(1, (os.cpu_count() or 2) // 2)
+        num_workers = min(num_workers, self.concurrency)
+        if num_workers != self.num_workers:
+            object.__setattr__(self, "num_workers", num_workers)
 
-    @field_validator("concurrency")
-    @classmethod
-    def validate_concurrency(cls, v: int, info: ValidationInfo) -> int:
-        """Ensure concurrency doesn't exceed total requests."""
-        if info.data:
-            total_requests = info.data.get("total_requests", 50)
-            if v > total_requests:
-                return total_requests
-        return v
-
-    @field_validator("stream")
-    @classmethod
-    def validate_stream(cls, v: bool, info: ValidationInfo) -> bool:
-        """Validate streaming configuration."""
         # Streaming requires reasonable timeout and token limits
-        if v and info.data:
-            timeout = info.data.get("timeout", 60.0)
-            max_tokens = info.data.get("max_tokens", 128)
-
-            if timeout < 30.0:
+        if self.stream:
+            if self.timeout < 30.0:
                 raise ValueError("Streaming mode requires timeout >= 30 seconds")
-            if max_tokens > 1000:
+            if self.max_tokens > 1000:
                 raise ValueError(
                     "Streaming mode with high max_tokens may cause timeouts"
                 )
-        return v
 
-    def get_request_payload_template(self) -> dict[str, Any]:
-        """Get template payload for API requests."""
         payload = {
             "model": self.model_name,
             "max_tokens": self.max_tokens,
             "temperature": self.temperature,
         }
-
         if self.stream:
             payload["stream"] = True
+        object.__setattr__(self, "_payload_template", MappingProxyType(payload))
 
-        return payload
-
-    def get_summary(self) -> dict[str, Any]:
-        """Get configuration summary for logging."""
-        return {
+        summary = {
             "url": self.url,
             "model": self.model_name,
             "max_tokens": self.max_tokens,
@@ -138,4 +166,53 @@ class LoadTestConfig(BaseModel):
             "warmup_count": self.warmup_count,
             "stream_enabled": self.stream,
             "timeout": self.timeout,
+            "target_qps": self.target_qps,
+            "num_workers": self.num_workers,
         }
+        object.__setattr__(self, "_summary", MappingProxyType(summary))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle through ``__init__`` so derived fields are rebuilt.
+
+        Needed to hand configs to worker processes: the read-only
+        MappingProxyType caches can't be pickled themselves.
+        """
+        return (
+            self.__class__,
+            tuple(getattr(self, f.name) for f in fields(self) if f.init),
+        )
+
+    @classmethod
+    def from_env(cls, refresh: bool = True, **overrides: Any) -> "LoadTestConfig":
+        """Create a config from environment variables.
+
+        Args:
+            refresh: Re-read the environment instead of reusing the snapshot
+                taken at import time.
+            **overrides: Explicit field values, taking precedence over env.
+
+        Returns:
+            LoadTestConfig: Validated configuration.
+        """
+        env = _snapshot_env() if refresh else _ENV
+        values = {f.name: getattr(env, f.name) for f in fields(env)}
+        values.update(overrides)
+        return cls(**values)
+
+    def get_request_payload_template(self) -> dict[str, Any]:
+        """Get template payload for API requests.
+
+        Returns a copy of the precomputed template, so callers may mutate it
+        without affecting the config.
+        """
+        payload = dict(self._payload_template)
+        if self.stream:
+            # Ask for a final usage chunk so completion tokens come from the
+            # server instead of being estimated from the streamed text. Nested,
+            # so built per call rather than shared through the template.
+            payload["stream_options"] = {"include_usage": True}
+        return payload
+
+    def get_summary(self) -> Mapping[str, Any]:
+        """Get configuration summary for logging (read-only, built once)."""
+        return self._summary
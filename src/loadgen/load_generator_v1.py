@@ -3,22 +3,211 @@ Load Generator V1
 """
 
 import asyncio
-import json
+import dataclasses
 import logging
+import math
+import multiprocessing
+import re
+import socket
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any
+from collections import Counter
+from collections.abc import AsyncIterator, Coroutine, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
 
-import httpx
+import aiohttp
+import numpy as np
+import orjson
+from yarl import URL
+
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 from .config import LoadTestConfig
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+_T = TypeVar("_T")
+
+# SSE framing of the streaming response
+_DATA_PREFIX = b"data: "
+_DATA_PREFIX_LEN = len(_DATA_PREFIX)
+_DONE_LINE = b"data: [DONE]"
+
+# Streaming chunks are scanned for these byte patterns rather than fully parsed
+_CONTENT_KEY = b'"content":"'
+# Key only: servers differ in spacing after the colon (and may send null)
+_USAGE_KEY = b'"usage"'
+# What must follow the key for the value to be an object rather than null
+_USAGE_OBJECT_VALUE = re.compile(rb"[ \t\r\n]*:[ \t\r\n]*\{")
+
+
+def _find_string_end(buf: bytes, start: int) -> int:
+    """Find the closing quote of a JSON string body starting at ``start``.
+
+    Returns -1 if the string is unterminated.
+    """
+    end = buf.find(b'"', start)
+    while end != -1:
+        # The quote is escaped only if preceded by an odd number of backslashes
+        i = end - 1
+        while i >= start and buf[i] == 0x5C:
+            i -= 1
+        if (end - 1 - i) % 2 == 0:
+            return end
+        end = buf.find(b'"', end + 1)
+    return -1
+
+
+def _delta_content(data: dict[str, Any]) -> str | None:
+    """Get ``choices[0].delta.content`` from a parsed streaming chunk."""
+    choices = data.get("choices")
+    if choices and "delta" in choices[0]:
+        return choices[0]["delta"].get("content")
+    return None
+
+
+def _extract_delta_content(event: bytes) -> str | None:
+    """Get ``choices[0].delta.content`` from a raw streaming chunk.
+
+    Slices the string straight out of the bytes instead of building the whole
+    chunk as Python objects; falls back to a full orjson parse for layouts the
+    scan doesn't recognize (e.g. whitespace after the colon).
+    """
+    start = event.find(_CONTENT_KEY)
+    if start == -1:
+        if b'"content"' not in event:
+            return None  # role-only or finish chunk
+        return _delta_content(orjson.loads(event))
+
+    start += len(_CONTENT_KEY)
+    end = _find_string_end(event, start)
+    if end == -1:
+        return _delta_content(orjson.loads(event))  # raises on malformed input
+
+    content = event[start:end]
+    if b"\\" in content:
+        # Unescape via orjson only for the string itself
+        return orjson.loads(event[start - 1 : end + 1])
+    return content.decode()
+
+
+def _find_usage_object(buf: bytes) -> int:
+    """Find the ``{`` opening the last ``usage`` object in a raw JSON chunk.
+
+    Only the colon and whitespace may sit between key and object, compact
+    ("usage":{) or spaced ("usage": {). Returns -1 if there is no usage key
+    or its value is not an object (e.g. the per-chunk ``"usage":null``).
+    """
+    key = buf.rfind(_USAGE_KEY)
+    if key == -1:
+        return -1
+    # Anchored match in place: no slicing or stripping copies of the chunk
+    match = _USAGE_OBJECT_VALUE.match(buf, key + len(_USAGE_KEY))
+    return -1 if match is None else match.end() - 1
+
+
+def _extract_usage(body: bytes) -> dict[str, Any]:
+    """Get the ``usage`` object from a raw non-streaming completion body.
+
+    Only the usage object is parsed, located from the end of the body where
+    servers put it, so long completions aren't built into Python objects;
+    falls back to a full orjson parse if it can't be isolated.
+    """
+    start = _find_usage_object(body)
+    if start != -1:
+        # Usage holds only numbers and nested objects (no strings), so the
+        # first span with balanced braces is the whole object
+        end = body.find(b"}", start)
+        while end != -1:
+            span = body[start : end + 1]
+            if span.count(b"{") == span.count(b"}"):
+                try:
+                    return orjson.loads(span)
+                except orjson.JSONDecodeError:
+                    break
+            end = body.find(b"}", end + 1)
+    return orjson.loads(body).get("usage") or {}
+
+
+class SSEFramer:
+    """Incremental line framer for a server-sent events byte stream.
+
+    Remembers how far the pending partial line has already been scanned, so
+    each chunk costs O(len(chunk)) rather than a rescan of everything buffered.
+    """
+
+    __slots__ = ("_buf", "_scan_pos")
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._scan_pos = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Buffer a chunk and return the lines it completes, without line endings."""
+        buf = self._buf
+        buf.extend(chunk)
+
+        lines = []
+        start = 0
+        end = buf.find(b"\n", self._scan_pos)
+        while end != -1:
+            lines.append(bytes(buf[start:end]).rstrip(b"\r"))
+            start = end + 1
+            end = buf.find(b"\n", start)
+
+        if start:
+            del buf[:start]
+        self._scan_pos = len(buf)
+        return lines
+
+
+def _keepalive_socket(addr_info: aiohttp.AddrInfoType) -> socket.socket:
+    """Create a client socket with TCP keep-alive enabled.
+
+    Keeps a connection that sits idle through a long generation from being
+    dropped by NATs/load balancers. TCP_NODELAY is already set by aiohttp
+    on every connection, so small SSE writes aren't held back by Nagle.
+    """
+    family, type_, proto, _, _ = addr_info
+    sock = socket.socket(family=family, type=type_, proto=proto)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    return sock
+
+
+async def _iter_sse_lines(
+    content: aiohttp.StreamReader, max_bytes: int
+) -> AsyncIterator[bytes]:
+    """Yield SSE lines from a response body as chunks arrive.
+
+    Raises:
+        ValueError: If the body grows past ``max_bytes`` (e.g. a server that
+            never sends ``[DONE]``), so memory per request stays bounded.
+    """
+    framer = SSEFramer()
+    received = 0
+    async for chunk in content.iter_any():
+        received += len(chunk)
+        if received > max_bytes:
+            raise ValueError(f"SSE response exceeded {max_bytes} bytes")
+        for line in framer.feed(chunk):
+            yield line
+
+
+@dataclass(slots=True)
 class RequestResult:
-    """Result of a single API request."""
+    """Result of a single API request.
+
+    Only built for failures on the load test path; successful requests are
+    recorded as plain ``_Sample`` tuples.
+    """
 
     latency_ms: float
     ttft_ms: float | None  # Time-to-First-Token for streaming
@@ -30,7 +219,109 @@ class RequestResult:
     tokens_per_second: float | None = None  # Generation speed
 
 
-@dataclass
+# A successful request, recorded without building a RequestResult:
+# (latency_ms, ttft_ms or NaN, total_tokens, tokens_per_second)
+_Sample = tuple[float, float, int, float]
+
+
+class _ResultColumns:
+    """Per-request measurements stored column-wise in preallocated arrays.
+
+    Results are written in as they complete, so a run keeps 21 bytes per
+    request (exact values, no sketching) instead of a RequestResult object
+    each. NaN marks values that weren't measured (e.g. TTFT without
+    streaming). Failure reasons are kept as counts per distinct error.
+    """
+
+    __slots__ = (
+        "count",
+        "errors",
+        "latency_ms",
+        "schedule_delay_ms",
+        "success",
+        "tokens_per_second",
+        "total_tokens",
+        "ttft_ms",
+    )
+
+    def __init__(self, size: int):
+        self.count = 0
+        self.errors: Counter[str] = Counter()
+        self.latency_ms = np.empty(size, dtype=np.float32)
+        self.ttft_ms = np.empty(size, dtype=np.float32)
+        self.tokens_per_second = np.empty(size, dtype=np.float32)
+        self.schedule_delay_ms = np.empty(size, dtype=np.float32)
+        # Per-request counts fit easily; sums are accumulated in int64
+        self.total_tokens = np.empty(size, dtype=np.int32)
+        self.success = np.empty(size, dtype=np.bool_)
+
+    def append(self, sample: _Sample, schedule_delay_ms: float) -> None:
+        """Record a successful request in the next free slot."""
+        i = self.count
+        (
+            self.latency_ms[i],
+            self.ttft_ms[i],
+            self.total_tokens[i],
+            self.tokens_per_second[i],
+        ) = sample
+        self.schedule_delay_ms[i] = schedule_delay_ms
+        self.success[i] = True
+        self.count = i + 1
+
+    def append_failure(
+        self, latency_ms: float, schedule_delay_ms: float, error: str | None
+    ) -> None:
+        """Record a failed request in the next free slot and count its error."""
+        self.errors[error or "Unknown error"] += 1
+        i = self.count
+        self.latency_ms[i] = latency_ms
+        self.ttft_ms[i] = np.nan
+        self.total_tokens[i] = 0
+        self.tokens_per_second[i] = np.nan
+        self.schedule_delay_ms[i] = schedule_delay_ms
+        self.success[i] = False
+        self.count = i + 1
+
+    @classmethod
+    def concat(cls, parts: Sequence["_ResultColumns"]) -> "_ResultColumns":
+        """Merge the filled slots of several buffers (e.g. from worker processes)."""
+        merged = cls(0)
+        merged.count = sum(part.count for part in parts)
+        for part in parts:
+            merged.errors.update(part.errors)
+        for name in cls.__slots__:
+            if name not in ("count", "errors"):
+                setattr(
+                    merged,
+                    name,
+                    np.concatenate([getattr(p, name)[: p.count] for p in parts]),
+                )
+        return merged
+
+
+def _percentiles(
+    sorted_values: np.ndarray, percentiles: Sequence[float]
+) -> list[float]:
+    """Calculate percentiles of an ascending array (nearest-rank), rounded to 0.1.
+
+    At an exact rank (``p/100 * n`` is an integer) the value is averaged with
+    the next one. Only indexes into the array, so any number of queries
+    share a single sort.
+    """
+    n = sorted_values.size
+    if n == 0:
+        return [0.0] * len(percentiles)
+
+    ranks = np.asarray(percentiles, dtype=np.float64) / 100 * n
+    floor = np.floor(ranks).astype(np.intp)
+    exact = (ranks == floor) & (ranks > 0)
+    lo = np.where(exact, floor - 1, floor).clip(0, n - 1)
+    hi = np.where(exact, floor, lo).clip(0, n - 1)
+    values = (sorted_values[lo] + sorted_values[hi]) / 2
+    return [round(float(value), 1) for value in values]
+
+
+@dataclass(slots=True)
 class LoadTestResults:
     """Aggregated results of load test."""
 
@@ -39,9 +330,23 @@ class LoadTestResults:
     failed_requests: int
     total_tokens: int
     elapsed_time: float
-    latencies: list[float]
-    ttft_latencies: list[float]  # Time-to-First-Token measurements
-    generation_speeds: list[float]  # Tokens per second per request
+    # Per-request samples of successful requests (float32 arrays)
+    latencies: np.ndarray
+    ttft_latencies: np.ndarray  # Time-to-First-Token measurements
+    generation_speeds: np.ndarray  # Tokens per second per request
+    # Send lateness against the target_qps schedule (empty without one)
+    schedule_delays: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.float32)
+    )
+    # Number of failed requests per error message
+    errors: Mapping[str, int] = field(default_factory=dict)
+    # Ascending float64 copies of the samples, sorted on first percentile query
+    _sorted_latencies: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sorted_ttft: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def success_rate(self) -> float:
@@ -64,71 +369,90 @@ class LoadTestResults:
             return self.successful_requests / self.elapsed_time
         return 0.0
 
+    def latency_percentiles(
+        self, percentiles: Sequence[float] = (50, 95, 99)
+    ) -> list[float]:
+        """Calculate several latency percentiles in one vectorized pass."""
+        if self._sorted_latencies is None:
+            self._sorted_latencies = np.sort(self.latencies.astype(np.float64))
+        return _percentiles(self._sorted_latencies, percentiles)
+
+    def ttft_percentiles(
+        self, percentiles: Sequence[float] = (50, 95, 99)
+    ) -> list[float]:
+        """Calculate several TTFT percentiles in one vectorized pass."""
+        if self._sorted_ttft is None:
+            self._sorted_ttft = np.sort(self.ttft_latencies.astype(np.float64))
+        return _percentiles(self._sorted_ttft, percentiles)
+
     def get_percentile(self, percentile: float) -> float:
         """Calculate latency percentile using nearest-rank method."""
-        if not self.latencies:
-            return 0.0
-
-        sorted_latencies = sorted(self.latencies)
-        n = len(sorted_latencies)
-
-        # Use nearest-rank method: P = (percentile/100) * n
-        rank = percentile / 100 * n
-
-        # Convert to 0-based index
-        if rank == int(rank) and rank > 0:
-            # Exact rank - average with next value for better accuracy
-            index = int(rank) - 1
-            if index + 1 < n:
-                value = (sorted_latencies[index] + sorted_latencies[index + 1]) / 2
-            else:
-                value = sorted_latencies[index]
-        else:
-            # Round up to next index
-            index = min(int(rank), n - 1)
-            value = sorted_latencies[index]
-
-        return round(value, 1)
+        return self.latency_percentiles((percentile,))[0]
 
     def get_ttft_percentile(self, percentile: float) -> float:
         """Calculate TTFT percentile using nearest-rank method."""
-        if not self.ttft_latencies:
-            return 0.0
-
-        sorted_ttft = sorted(self.ttft_latencies)
-        n = len(sorted_ttft)
-
-        # Use nearest-rank method: P = (percentile/100) * n
-        rank = percentile / 100 * n
-
-        # Convert to 0-based index
-        if rank == int(rank) and rank > 0:
-            # Exact rank - average with next value for better accuracy
-            index = int(rank) - 1
-            if index + 1 < n:
-                value = (sorted_ttft[index] + sorted_ttft[index + 1]) / 2
-            else:
-                value = sorted_ttft[index]
-        else:
-            # Round up to next index
-            index = min(int(rank), n - 1)
-            value = sorted_ttft[index]
-
-        return round(value, 1)
+        return self.ttft_percentiles((percentile,))[0]
 
     @property
     def avg_generation_speed(self) -> float:
         """Calculate average generation speed (tokens/sec per request)."""
-        if not self.generation_speeds:
+        if self.generation_speeds.size == 0:
             return 0.0
-        return sum(self.generation_speeds) / len(self.generation_speeds)
+        return float(self.generation_speeds.mean())
 
     @property
     def avg_ttft_ms(self) -> float:
         """Calculate average Time-to-First-Token."""
-        if not self.ttft_latencies:
+        if self.ttft_latencies.size == 0:
             return 0.0
-        return sum(self.ttft_latencies) / len(self.ttft_latencies)
+        return float(self.ttft_latencies.mean())
+
+    @property
+    def avg_schedule_delay_ms(self) -> float:
+        """Calculate average send lateness against the target_qps schedule."""
+        if self.schedule_delays.size == 0:
+            return 0.0
+        return float(self.schedule_delays.mean())
+
+
+class _JSONLogArg:
+    """Log argument rendered as compact JSON, serialized at most once.
+
+    Serialization is deferred until a handler actually emits the record, and
+    the text is cached so every handler formatting it shares one encode.
+    """
+
+    __slots__ = ("_data", "_text")
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        self._data = data
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = orjson.dumps(dict(self._data)).decode()
+        return self._text
+
+
+def _failed_request(
+    start_ns: int, ttft_ms: float | None, exc: Exception
+) -> RequestResult:
+    """Build the failed result for a request that raised ``exc``."""
+    if isinstance(exc, asyncio.TimeoutError):
+        error = f"Timeout: {str(exc)}"
+    elif isinstance(exc, aiohttp.ClientResponseError):
+        error = f"HTTP {exc.status}: {str(exc)}"
+    else:
+        error = str(exc)
+    return RequestResult(
+        latency_ms=(time.perf_counter_ns() - start_ns) / 1e6,
+        ttft_ms=ttft_ms,
+        prompt_tokens=0,
+        completion_tokens=0,
+        total_tokens=0,
+        success=False,
+        error=error,
+    )
 
 
 class LoadGeneratorV1:
@@ -136,171 +460,187 @@ class LoadGeneratorV1:
 
     def __init__(self, config: LoadTestConfig):
         self.config = config
-        self._setup_client()
+        # Created by _setup_client() once an event loop is running
+        self.session: aiohttp.ClientSession | None = None
+        # Fixed per run: parse the URL and serialize the body once, not per request
+        self._url = URL(config.url)
+        self._payload = self._create_payload()
+        # The mode is fixed for a run, so pick the request path once
+        self._make_request = (
+            self._make_request_streaming
+            if config.stream
+            else self._make_request_nonstreaming
+        )
 
     def _setup_client(self) -> None:
-        """Setup HTTP client with headers and concurrency settings."""
+        """Setup HTTP session with headers and concurrency settings.
+
+        Uses aiohttp rather than httpx: httpx's connection pool serializes
+        requests past a few dozen in flight, which skews the latencies we
+        are trying to measure. Must be called from within a running event loop.
+        """
         headers = {"Content-Type": "application/json"}
         if self.config.api_key:
             headers["Authorization"] = f"Bearer {self.config.api_key}"
         else:
             headers["Authorization"] = "Bearer dummy"  # Fallback for testing
 
-        # Ensure sufficient connections for concurrency
+        # Ensure sufficient connections for concurrency. Deliberately HTTP/1.1
+        # (aiohttp has no HTTP/2 client): one connection per in-flight request
+        # mirrors how most clients hit vLLM, and avoids HTTP/2's TCP-level
+        # head-of-line blocking folding one slow stream into the others' latency
         max_connections = max(self.config.concurrency * 2, 20)
-        max_keepalive = max(self.config.concurrency, 10)
-
-        self.client = httpx.AsyncClient(
-            headers=headers,
-            timeout=httpx.Timeout(self.config.timeout),
-            limits=httpx.Limits(
-                max_connections=max_connections,
-                max_keepalive_connections=max_keepalive,
-            ),
+
+        # All requests go to a single host, so the per-host limit is the pool size
+        connector = aiohttp.TCPConnector(
+            limit=max_connections,
+            limit_per_host=max_connections,
+            ttl_dns_cache=300,
+            socket_factory=_keepalive_socket,
         )
+        # Per-phase timeouts (connect incl. pool wait, and each socket read)
+        # rather than a total, so long streams are not cut off mid-generation
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=self.config.timeout,
+            sock_read=self.config.timeout,
+        )
+        self.session = aiohttp.ClientSession(
+            headers=headers, connector=connector, timeout=timeout
+        )
+
+    def _create_payload(self) -> bytes:
+        """Serialize the request payload from the config template.
 
-    def _create_payload(self) -> dict[str, Any]:
-        """Create request payload using config template."""
-        return self.config.get_request_payload_template()
+        Every request sends the same body, so this runs once per generator
+        and the bytes are reused (sent with the session's JSON content type).
+        """
+        return orjson.dumps(self.config.get_request_payload_template())
 
-    async def _make_request(self) -> RequestResult:
-        """Make a single API request and measure performance."""
-        payload = self._create_payload()
-        start_time = time.time()
-        ttft_time = None
+    async def _make_request_streaming(self) -> _Sample | RequestResult:
+        """Make a single streaming API request and measure TTFT and latency.
+
+        Returns:
+            A ``_Sample`` tuple on success, or a RequestResult describing the
+            failure.
+        """
+        # Monotonic integer nanoseconds; converted to ms once per measurement
+        start_ns = time.perf_counter_ns()
+        ttft_ms = None
 
         try:
-            if self.config.stream:
-                # Streaming request for TTFT measurement
-                async with self.client.stream(
-                    "POST", self.config.url, json=payload
-                ) as response:
-                    response.raise_for_status()
-
-                    first_token_time = None
-                    generation_start_time = None
-                    prompt_tokens = 0
-                    completion_tokens = 0
-
-                    # Process streaming response
-                    async for line in response.aiter_lines():
-                        if not line or not line.startswith("data: "):
+            async with self.session.post(self._url, data=self._payload) as response:
+                response.raise_for_status()
+
+                first_token_ns = None
+                prompt_tokens = 0
+                completion_tokens = None  # Set from the usage chunk, if any
+                content_chars = 0
+
+                # Process streaming response
+                # Lines stay as bytes: orjson parses them without a decode step
+                async with aclosing(
+                    _iter_sse_lines(response.content, self.config.max_response_bytes)
+                ) as lines:
+                    async for line in lines:
+                        if not line or not line.startswith(_DATA_PREFIX):
                             continue
 
-                        if line == "data: [DONE]":
+                        if line == _DONE_LINE:
                             break
 
                         try:
-                            # Parse SSE data
-                            data = json.loads(line[6:])  # Remove "data: " prefix
+                            event = line[_DATA_PREFIX_LEN:]
+
+                            # Only the (final) usage chunk needs a full parse;
+                            # token deltas, including those carrying
+                            # "usage":null, are read straight from the bytes
+                            if _find_usage_object(event) != -1:
+                                data = orjson.loads(event)
+                                content = _delta_content(data)
+                                usage = data.get("usage")
+                            else:
+                                usage = None
+                                content = _extract_delta_content(event)
 
                             # Check for first token (TTFT measurement)
-                            if "choices" in data and data["choices"]:
-                                choice = data["choices"][0]
-                                if "delta" in choice and choice["delta"].get("content"):
-                                    if first_token_time is None:
-                                        first_token_time = time.time()
-                                        ttft_time = (
-                                            first_token_time - start_time
-                                        ) * 1000
-                                        generation_start_time = first_token_time
-
-                                    # Count tokens (approximation: 4 chars = 1 token)
-                                    content = choice["delta"]["content"]
-                                    completion_tokens += max(1, len(content) // 4)
+                            if content:
+                                if first_token_ns is None:
+                                    first_token_ns = time.perf_counter_ns()
+                                    ttft_ms = (first_token_ns - start_ns) / 1e6
+
+                                content_chars += len(content)
 
                             # Extract token usage if available in final message
-                            if "usage" in data:
-                                prompt_tokens = data["usage"].get("prompt_tokens", 0)
-                                completion_tokens = data["usage"].get(
-                                    "completion_tokens", completion_tokens
-                                )
+                            if usage:
+                                prompt_tokens = usage.get("prompt_tokens", 0)
+                                completion_tokens = usage.get("completion_tokens")
 
-                        except (json.JSONDecodeError, KeyError):
+                        except (orjson.JSONDecodeError, KeyError):
                             # Skip malformed SSE events
                             continue
 
-                    end_time = time.time()
+                end_ns = time.perf_counter_ns()
 
-                    # Calculate generation speed (tokens/sec after first token)
-                    if generation_start_time and completion_tokens > 0:
-                        generation_time = end_time - generation_start_time
-                        tokens_per_second = (
-                            completion_tokens / generation_time
-                            if generation_time > 0
-                            else 0
-                        )
-                    else:
-                        tokens_per_second = 0.0
-
-                    return RequestResult(
-                        latency_ms=(end_time - start_time) * 1000,
-                        ttft_ms=ttft_time,
-                        prompt_tokens=prompt_tokens,
-                        completion_tokens=completion_tokens,
-                        total_tokens=prompt_tokens + completion_tokens,
-                        success=True,
-                        tokens_per_second=tokens_per_second,
+                if completion_tokens is None:
+                    # No usage reported: estimate (approximation: 4 chars =
+                    # 1 token) once instead of per delta
+                    completion_tokens = (
+                        max(1, content_chars // 4) if content_chars else 0
                     )
-            else:
-                # Non-streaming request (existing logic)
-                response = await self.client.post(self.config.url, json=payload)
-                response.raise_for_status()
-                end_time = time.time()
 
-                data = response.json()
-                usage = data.get("usage", {})
-                completion_tokens = usage.get("completion_tokens", 0)
-
-                # For non-streaming, estimate generation speed (no TTFT available)
-                generation_time = end_time - start_time
-                tokens_per_second = (
-                    completion_tokens / generation_time if generation_time > 0 else 0
+                # Calculate generation speed (tokens/sec after first token)
+                if first_token_ns is not None and completion_tokens > 0:
+                    generation_time = (end_ns - first_token_ns) / 1e9
+                    tokens_per_second = (
+                        completion_tokens / generation_time
+                        if generation_time > 0
+                        else 0
+                    )
+                else:
+                    tokens_per_second = 0.0
+
+                return (
+                    (end_ns - start_ns) / 1e6,
+                    math.nan if ttft_ms is None else ttft_ms,
+                    prompt_tokens + completion_tokens,
+                    tokens_per_second,
                 )
+        except Exception as e:
+            return _failed_request(start_ns, ttft_ms, e)
 
-                return RequestResult(
-                    latency_ms=(end_time - start_time) * 1000,
-                    ttft_ms=None,  # Not measurable in non-streaming mode
-                    prompt_tokens=usage.get("prompt_tokens", 0),
-                    completion_tokens=completion_tokens,
-                    total_tokens=usage.get("total_tokens", 0),
-                    success=True,
-                    tokens_per_second=tokens_per_second,
-                )
+    async def _make_request_nonstreaming(self) -> _Sample | RequestResult:
+        """Make a single non-streaming API request and measure latency.
+
+        Returns:
+            A ``_Sample`` tuple on success, or a RequestResult describing the
+            failure.
+        """
+        start_ns = time.perf_counter_ns()
+
+        try:
+            async with self.session.post(self._url, data=self._payload) as response:
+                response.raise_for_status()
+                body = await response.read()
+            end_ns = time.perf_counter_ns()
+
+            usage = _extract_usage(body)
+            completion_tokens = usage.get("completion_tokens", 0)
 
-        except httpx.TimeoutException as e:
-            end_time = time.time()
-            return RequestResult(
-                latency_ms=(end_time - start_time) * 1000,
-                ttft_ms=ttft_time,
-                prompt_tokens=0,
-                completion_tokens=0,
-                total_tokens=0,
-                success=False,
-                error=f"Timeout: {str(e)}",
+            # For non-streaming, estimate generation speed (no TTFT available)
+            generation_time = (end_ns - start_ns) / 1e9
+            tokens_per_second = (
+                completion_tokens / generation_time if generation_time > 0 else 0
             )
-        except httpx.HTTPStatusError as e:
-            end_time = time.time()
-            return RequestResult(
-                latency_ms=(end_time - start_time) * 1000,
-                ttft_ms=ttft_time,
-                prompt_tokens=0,
-                completion_tokens=0,
-                total_tokens=0,
-                success=False,
-                error=f"HTTP {e.response.status_code}: {str(e)}",
+
+            return (
+                (end_ns - start_ns) / 1e6,
+                math.nan,  # TTFT not measurable in non-streaming mode
+                usage.get("total_tokens", 0),
+                tokens_per_second,
             )
         except Exception as e:
-            end_time = time.time()
-            return RequestResult(
-                latency_ms=(end_time - start_time) * 1000,
-                ttft_ms=ttft_time,
-                prompt_tokens=0,
-                completion_tokens=0,
-                total_tokens=0,
-                success=False,
-                error=str(e),
-            )
+            return _failed_request(start_ns, None, e)
 
     async def _warmup(self) -> None:
         """Perform warmup requests."""
@@ -311,64 +651,94 @@ class LoadGeneratorV1:
             "Starting warmup",
             extra={"warmup_requests": self.config.warmup_count, "phase": "warmup"},
         )
+        # Request failures come back as RequestResult values, not exceptions
         warmup_tasks = [self._make_request() for _ in range(self.config.warmup_count)]
-        await asyncio.gather(*warmup_tasks, return_exceptions=True)
+        await asyncio.gather(*warmup_tasks)
         logger.info("Warmup completed", extra={"phase": "warmup"})
 
-    async def _run_load_test(self) -> list[RequestResult]:
-        """Run the main load test with concurrency control."""
-        # Create semaphore to limit concurrency
-        semaphore = asyncio.Semaphore(self.config.concurrency)
+    async def _run_load_test(self) -> _ResultColumns:
+        """Run the main load test with concurrency control.
+
+        A producer puts request due times on a bounded queue and
+        ``concurrency`` long-lived worker coroutines take them off and send
+        the requests, so only O(concurrency) coroutines ever exist. With
+        ``target_qps`` set, request ``i`` is due at ``t0 + i / target_qps`` no
+        matter how earlier requests are doing (open loop), and how late it
+        actually went out is recorded as ``schedule_delay_ms``. Otherwise the
+        next request goes out as soon as a worker frees up.
+        """
+        loop = asyncio.get_running_loop()
+        concurrency = self.config.concurrency
+        interval = 1 / self.config.target_qps if self.config.target_qps else None
+
+        results = _ResultColumns(self.config.total_requests)
+        # Due times (NaN when unpaced); None tells a worker to stop. Bounded so
+        # memory stays O(concurrency), with enough slack that a worker
+        # finishing a request never waits on the producer.
+        queue: asyncio.Queue[float | None] = asyncio.Queue(maxsize=concurrency * 4)
 
         # Thread-safe counters for progress tracking
         completed_requests = 0
         failed_requests = 0
 
-        async def bounded_request() -> RequestResult:
+        async def worker() -> None:
             nonlocal completed_requests, failed_requests
-            async with semaphore:
-                result = await self._make_request()
+            while (due_time := await queue.get()) is not None:
+                # NaN due time (unpaced) propagates to a NaN delay
+                schedule_delay_ms = (loop.time() - due_time) * 1000
+                try:
+                    outcome = await self._make_request()
+                except Exception as e:
+                    # Create failed result for unexpected exceptions
+                    logger.warning(
+                        "Unexpected exception in task",
+                        extra={"error": str(e), "phase": "load_test"},
+                    )
+                    outcome = RequestResult(
+                        latency_ms=0.0,
+                        ttft_ms=None,
+                        prompt_tokens=0,
+                        completion_tokens=0,
+                        total_tokens=0,
+                        success=False,
+                        error=f"Task exception: {str(e)}",
+                    )
+
                 # These operations are atomic in asyncio
                 completed_requests += 1
-                if not result.success:
+                if type(outcome) is tuple:
+                    results.append(outcome, schedule_delay_ms)
+                else:
+                    results.append_failure(
+                        outcome.latency_ms, schedule_delay_ms, outcome.error
+                    )
                     failed_requests += 1
-                return result
-
-        # Create all tasks
-        tasks = [bounded_request() for _ in range(self.config.total_requests)]
 
-        # Execute with concurrency control and exception handling
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
         try:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            start_time = loop.time()
+            for i in range(self.config.total_requests):
+                due_time = math.nan
+                if interval is not None:
+                    due_time = start_time + i * interval
+                    if (wait := due_time - loop.time()) > 0:
+                        await asyncio.sleep(wait)
+                await queue.put(due_time)
+
+            for _ in workers:
+                await queue.put(None)
+            # Wait for the requests still in flight
+            await asyncio.gather(*workers)
         except Exception as e:
             logger.error(
                 "Critical error during load test execution",
                 extra={"error": str(e), "phase": "load_test"},
             )
             raise
-
-        # Process results safely
-        valid_results = []
-        for result in results:
-            if isinstance(result, RequestResult):
-                valid_results.append(result)
-            elif isinstance(result, Exception):
-                # Create failed result for unexpected exceptions
-                logger.warning(
-                    "Unexpected exception in task",
-                    extra={"error": str(result), "phase": "load_test"},
-                )
-                valid_results.append(
-                    RequestResult(
-                        latency_ms=0.0,
-                        ttft_ms=None,
-                        prompt_tokens=0,
-                        completion_tokens=0,
-                        total_tokens=0,
-                        success=False,
-                        error=f"Task exception: {str(result)}",
-                    )
-                )
+        finally:
+            # Only still running if the producer failed or was cancelled
+            for task in workers:
+                task.cancel()
 
         logger.info(
             "Load test batch completed",
@@ -379,46 +749,121 @@ class LoadGeneratorV1:
             },
         )
 
-        return valid_results
+        return results
+
+    async def _run_workers(self) -> tuple[_ResultColumns, float]:
+        """Split the load test across worker processes.
+
+        Each worker runs its share of the request budget on its own event loop,
+        so SSE parsing and client overhead are spread across cores instead of
+        adding client-side latency on a single loop.
+
+        Shards warm up independently, then wait on a shared barrier so their
+        measured runs (and ``target_qps`` schedules) start together.
+
+        Returns:
+            tuple: Merged result columns and the wall time in seconds from the
+                first shard starting to the last one finishing (process
+                startup and warmup excluded).
+        """
+        num_workers = self.config.num_workers
+        base, extra = divmod(self.config.total_requests, num_workers)
+        base_conc, extra_conc = divmod(self.config.concurrency, num_workers)
+        base_warmup, extra_warmup = divmod(self.config.warmup_count, num_workers)
+        shard_configs = [
+            dataclasses.replace(
+                self.config,
+                total_requests=base + (i < extra),
+                concurrency=(
+                    self.config.worker_max_concurrency or base_conc + (i < extra_conc)
+                ),
+                target_qps=(
+                    self.config.target_qps / num_workers
+                    if self.config.target_qps
+                    else None
+                ),
+                # Each shard warms its own session: the parent's is never used
+                warmup_count=base_warmup + (i < extra_warmup),
+                num_workers=1,
+            )
+            for i in range(num_workers)
+        ]
+
+        loop = asyncio.get_running_loop()
+        # spawn: forking a process with a running event loop is unsafe
+        mp_context = multiprocessing.get_context("spawn")
+        with (
+            mp_context.Manager() as manager,
+            ProcessPoolExecutor(max_workers=num_workers, mp_context=mp_context) as pool,
+        ):
+            start_barrier = manager.Barrier(num_workers)
+            try:
+                shard_results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            pool, _run_worker_shard, shard_config, start_barrier
+                        )
+                        for shard_config in shard_configs
+                    )
+                )
+            except BaseException:
+                # Release shards still waiting for one that will never arrive
+                start_barrier.abort()
+                raise
+
+        results = _ResultColumns.concat([shard for shard, _, _ in shard_results])
+        # Wall-clock stamps: shards rarely finish together, so the run lasts
+        # from the earliest start to the latest end, not the longest shard
+        start_time = min(start for _, start, _ in shard_results)
+        end_time = max(end for _, _, end in shard_results)
+        return results, end_time - start_time
 
     def _aggregate_results(
-        self, results: list[RequestResult], elapsed_time: float
+        self, results: _ResultColumns, elapsed_time: float
     ) -> LoadTestResults:
         """Aggregate individual results into summary statistics."""
-        successful_results = [r for r in results if r.success]
-        failed_results = [r for r in results if not r.success]
+        n = results.count
+        success = results.success[:n]
+        successful_requests = int(np.count_nonzero(success))
 
-        total_tokens = sum(r.total_tokens for r in successful_results)
-        latencies = [r.latency_ms for r in successful_results]
+        # Each column is masked once; unmeasured (NaN) samples are dropped by
+        # the same mask rather than in a second filtering pass
+        total_tokens = int(results.total_tokens[:n].sum(where=success, dtype=np.int64))
+        latencies = results.latency_ms[:n][success]
 
         # Collect TTFT measurements (only available for streaming requests)
-        ttft_latencies = [
-            r.ttft_ms for r in successful_results if r.ttft_ms is not None
-        ]
+        ttft = results.ttft_ms[:n]
+        ttft_latencies = ttft[success & ~np.isnan(ttft)]
 
         # Collect generation speeds
-        generation_speeds = [
-            r.tokens_per_second
-            for r in successful_results
-            if r.tokens_per_second is not None
-        ]
+        speeds = results.tokens_per_second[:n]
+        generation_speeds = speeds[success & ~np.isnan(speeds)]
+
+        # Collect send lateness (only recorded with a target_qps schedule)
+        schedule_delays = results.schedule_delay_ms[:n]
+        schedule_delays = schedule_delays[~np.isnan(schedule_delays)]
 
         return LoadTestResults(
-            total_requests=len(results),
-            successful_requests=len(successful_results),
-            failed_requests=len(failed_results),
+            total_requests=n,
+            successful_requests=successful_requests,
+            failed_requests=n - successful_requests,
             total_tokens=total_tokens,
             elapsed_time=elapsed_time,
             latencies=latencies,
             ttft_latencies=ttft_latencies,
             generation_speeds=generation_speeds,
+            schedule_delays=schedule_delays,
+            errors=dict(results.errors),
         )
 
     async def run(self) -> LoadTestResults:
         """Run complete load test with warmup and cleanup."""
+        if self.session is None:
+            self._setup_client()
         try:
-            # Warmup phase
-            await self._warmup()
+            # Warmup phase (sharded runs warm up inside each worker instead)
+            if self.config.num_workers == 1:
+                await self._warmup()
 
             # Main load test
             logger.info(
@@ -426,14 +871,18 @@ class LoadGeneratorV1:
                 extra={
                     "total_requests": self.config.total_requests,
                     "concurrency": self.config.concurrency,
+                    "num_workers": self.config.num_workers,
                     "model": self.config.model_name,
                     "phase": "load_test",
                 },
             )
 
-            start_time = time.time()
-            results = await self._run_load_test()
-            elapsed_time = time.time() - start_time
+            if self.config.num_workers > 1:
+                results, elapsed_time = await self._run_workers()
+            else:
+                start_time = time.perf_counter()
+                results = await self._run_load_test()
+                elapsed_time = time.perf_counter() - start_time
 
             return self._aggregate_results(results, elapsed_time)
 
@@ -446,28 +895,31 @@ class LoadGeneratorV1:
             )
             raise
         finally:
-            # Ensure client is always closed cleanly
+            # Ensure session is always closed cleanly
             try:
-                await self.client.aclose()
-                logger.debug("HTTP client closed", extra={"phase": "cleanup"})
+                await self.session.close()
+                self.session = None
+                logger.debug("HTTP session closed", extra={"phase": "cleanup"})
             except Exception as e:
                 logger.warning(
-                    "Error closing HTTP client",
+                    "Error closing HTTP session",
                     extra={"error": str(e), "phase": "cleanup"},
                 )
 
     def log_results(self, results: LoadTestResults) -> None:
         """Log structured results."""
         # Log configuration summary first
-        logger.info("Load test configuration", extra=self.config.get_summary())
+        summary = self.config.get_summary()
+        logger.info("Load test configuration: %s", _JSONLogArg(summary), extra=summary)
 
+        latency_p50, latency_p95, latency_p99 = results.latency_percentiles()
         log_data = {
             "phase": "results",
             "tokens_per_second": round(results.tokens_per_second, 2),
             "requests_per_second": round(results.requests_per_second, 2),
-            "latency_p50": results.get_percentile(50),
-            "latency_p95": results.get_percentile(95),
-            "latency_p99": results.get_percentile(99),
+            "latency_p50": latency_p50,
+            "latency_p95": latency_p95,
+            "latency_p99": latency_p99,
             "total_requests": results.total_requests,
             "successful_requests": results.successful_requests,
             "failed_requests": results.failed_requests,
@@ -478,13 +930,14 @@ class LoadGeneratorV1:
         }
 
         # Add TTFT metrics if available (streaming mode)
-        if results.ttft_latencies:
+        if results.ttft_latencies.size:
+            ttft_p50, ttft_p95, ttft_p99 = results.ttft_percentiles()
             log_data.update(
                 {
                     "ttft_avg_ms": round(results.avg_ttft_ms, 2),
-                    "ttft_p50": results.get_ttft_percentile(50),
-                    "ttft_p95": results.get_ttft_percentile(95),
-                    "ttft_p99": results.get_ttft_percentile(99),
+                    "ttft_p50": ttft_p50,
+                    "ttft_p95": ttft_p95,
+                    "ttft_p99": ttft_p99,
                     "streaming_enabled": True,
                 }
             )
@@ -492,12 +945,73 @@ class LoadGeneratorV1:
             log_data["streaming_enabled"] = False
 
         # Add generation speed metrics if available
-        if results.generation_speeds:
+        if results.generation_speeds.size:
             log_data["avg_generation_speed_tps"] = round(
                 results.avg_generation_speed, 2
             )
 
-        logger.info("Load test completed", extra=log_data)
+        # Add schedule accuracy if requests were paced (target_qps)
+        if results.schedule_delays.size:
+            log_data.update(
+                {
+                    "target_qps": self.config.target_qps,
+                    "schedule_delay_avg_ms": round(results.avg_schedule_delay_ms, 2),
+                    "schedule_delay_max_ms": round(
+                        float(results.schedule_delays.max()), 2
+                    ),
+                }
+            )
+
+        # Add failure reasons, most frequent first
+        if results.errors:
+            log_data["errors"] = dict(
+                sorted(results.errors.items(), key=lambda item: -item[1])
+            )
+
+        logger.info("Load test completed: %s", _JSONLogArg(log_data), extra=log_data)
+
+
+def _run(main: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine on a fresh event loop, using uvloop when installed.
+
+    libuv's I/O loop has less per-socket overhead than the default selector
+    loop, which leaves more headroom before the client itself adds latency.
+    """
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
+def _run_worker_shard(
+    config: LoadTestConfig, start_barrier: threading.Barrier
+) -> tuple[_ResultColumns, float, float]:
+    """Worker process entry point: run one shard of the load test.
+
+    The shard warms up, then waits on ``start_barrier`` (a manager proxy
+    shared by all shards) so the measured runs overlap.
+
+    Returns:
+        tuple: The shard's result columns and the wall-clock (``time.time()``)
+            start and end of its run, comparable across processes.
+    """
+
+    async def run_shard() -> tuple[_ResultColumns, float, float]:
+        generator = LoadGeneratorV1(config)
+        generator._setup_client()
+        try:
+            try:
+                await generator._warmup()
+            except BaseException:
+                start_barrier.abort()  # Don't leave the other shards waiting
+                raise
+            await asyncio.to_thread(start_barrier.wait)
+            start_time = time.time()
+            results = await generator._run_load_test()
+            return results, start_time, time.time()
+        finally:
+            await generator.session.close()
+
+    return _run(run_shard())
 
 
 async def main() -> None:
@@ -516,4 +1030,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    _run(main())
@@ -22,6 +22,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Device handles are stable for the life of the process; filled by init_nvidia()
+_HANDLES: list[Any] = []
+
 
 def init_nvidia() -> bool:
     """Initialize NVIDIA ML library.
@@ -35,6 +38,9 @@ def init_nvidia() -> bool:
 
     try:
         nvmlInit()
+        _HANDLES[:] = [
+            nvmlDeviceGetHandleByIndex(i) for i in range(nvmlDeviceGetCount())
+        ]
         logger.info("NVIDIA ML library initialized successfully")
         return True
     except Exception as e:
@@ -53,12 +59,9 @@ def get_gpu_metrics() -> dict[str, Any]:
         return {}
 
     try:
-        device_count = nvmlDeviceGetCount()
         metrics = {}
 
-        for i in range(device_count):
-            handle = nvmlDeviceGetHandleByIndex(i)
-
+        for i, handle in enumerate(_HANDLES):
             # GPU utilization
             util = nvmlDeviceGetUtilizationRates(handle)
             metrics[f"gpu_{i}_utilization"] = util.gpu
@@ -82,7 +85,7 @@ def get_gpu_metrics() -> dict[str, Any]:
                 # Power usage not available on all GPUs
                 pass
 
-        logger.debug(f"Collected metrics for {device_count} GPU device(s)")
+        logger.debug(f"Collected metrics for {len(_HANDLES)} GPU device(s)")
         return metrics
 
     except Exception as e:
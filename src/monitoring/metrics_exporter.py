@@ -3,9 +3,9 @@ GPU and system metrics exporter for OpenTelemetry.
 Sends metrics to OBS stack via OTLP.
 """
 
+import asyncio
 import logging
 import os
-import time
 from typing import Any
 
 from opentelemetry import metrics
@@ -105,27 +105,56 @@ class MetricsExporter:
 
         return all_metrics
 
+    async def collect_metrics_async(self) -> dict[str, Any]:
+        """Collect all metrics, querying the sources concurrently.
+
+        The collectors block (psutil, NVML, HTTP), so each runs in a worker
+        thread; a slow vLLM endpoint no longer holds up the local reads.
+
+        Returns:
+            Dict[str, Any]: Combined metrics from all sources.
+        """
+        collectors = [asyncio.to_thread(get_system_metrics)]
+        if self.nvidia_available:
+            collectors.append(asyncio.to_thread(get_gpu_metrics))
+        collectors.append(asyncio.to_thread(get_vllm_metrics, self.vllm_port))
+
+        all_metrics = {}
+        for source_metrics in await asyncio.gather(*collectors):
+            all_metrics.update(source_metrics)
+
+        return all_metrics
+
     def export_metrics(self, metrics_data: dict[str, Any]):
         """Export metrics to OpenTelemetry.
 
         Args:
             metrics_data: Dictionary of metric name -> value pairs.
         """
+        gauges = self.gauges
         for metric_name, value in metrics_data.items():
-            if metric_name not in self.gauges:
-                self.gauges[metric_name] = self.meter.create_gauge(
+            # One lookup per metric; gauges are only created on first sight
+            gauge = gauges.get(metric_name)
+            if gauge is None:
+                gauge = gauges[metric_name] = self.meter.create_gauge(
                     name=metric_name, description=f"Metric {metric_name}", unit="1"
                 )
-            self.gauges[metric_name].set(value)
+            gauge.set(value)
 
     def run(self):
         """Main metrics collection loop."""
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        """Main metrics collection loop, for callers with a running event loop."""
         logger.info("Starting metrics collection loop")
+        loop = asyncio.get_running_loop()
 
         while True:
+            started = loop.time()
             try:
                 # Collect metrics
-                metrics_data = self.collect_metrics()
+                metrics_data = await self.collect_metrics_async()
 
                 # Export metrics
                 self.export_metrics(metrics_data)
@@ -135,7 +164,10 @@ class MetricsExporter:
             except Exception as e:
                 logger.error(f"Error in metrics collection: {e}")
 
-            time.sleep(self.collect_interval)
+            # Sleep out the rest of the interval so collection time doesn't
+            # make the ticks drift
+            elapsed = loop.time() - started
+            await asyncio.sleep(max(0.0, self.collect_interval - elapsed))
 
 
 def create_exporter_from_env() -> MetricsExporter:
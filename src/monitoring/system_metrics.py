@@ -1,12 +1,59 @@
 """System metrics collection using psutil."""
 
 import logging
+import os
+import sys
 from typing import Any
 
 import psutil
 
 logger = logging.getLogger(__name__)
 
+# On Linux, CPU and memory counters are read straight from /proc, skipping
+# psutil's full parse of every field; other platforms go through psutil
+_PROC_STAT = "/proc/stat"
+_PROC_MEMINFO = "/proc/meminfo"
+_USE_PROC = sys.platform.startswith("linux") and os.path.exists(_PROC_STAT)
+
+
+def _read_cpu_times() -> tuple[int, int]:
+    """Read (idle, total) jiffies from the aggregate CPU line of /proc/stat."""
+    with open(_PROC_STAT, "rb") as f:
+        # user nice system idle iowait irq softirq steal; guest time is
+        # already counted in user/nice
+        times = [int(value) for value in f.readline().split()[1:9]]
+    return times[3] + times[4], sum(times)
+
+
+def _read_meminfo() -> tuple[int, int]:
+    """Read (total, available) memory in bytes from /proc/meminfo."""
+    total = available = 0
+    with open(_PROC_MEMINFO, "rb") as f:
+        for line in f:
+            if line.startswith(b"MemTotal:"):
+                total = int(line.split()[1]) * 1024
+            elif line.startswith(b"MemAvailable:"):
+                available = int(line.split()[1]) * 1024
+                break
+    return total, available
+
+
+# CPU times at the previous cpu_percent sample
+_last_cpu_times = _read_cpu_times() if _USE_PROC else (0, 0)
+
+
+def _cpu_percent() -> float:
+    """CPU utilization since the previous call, like ``psutil.cpu_percent()``."""
+    global _last_cpu_times
+    idle, total = _read_cpu_times()
+    last_idle, last_total = _last_cpu_times
+    _last_cpu_times = (idle, total)
+
+    total_delta = total - last_total
+    if total_delta <= 0:
+        return 0.0
+    return round(100.0 * (1 - (idle - last_idle) / total_delta), 1)
+
 
 def get_system_metrics() -> dict[str, Any]:
     """Get system metrics including CPU, memory, disk, and load average.
@@ -18,14 +65,25 @@ def get_system_metrics() -> dict[str, Any]:
 
     try:
         # CPU metrics
-        metrics["cpu_percent"] = psutil.cpu_percent()
+        if _USE_PROC:
+            metrics["cpu_percent"] = _cpu_percent()
+        else:
+            metrics["cpu_percent"] = psutil.cpu_percent()
         metrics["cpu_count"] = psutil.cpu_count()
 
         # Memory metrics
-        mem = psutil.virtual_memory()
-        metrics["memory_total"] = mem.total
-        metrics["memory_available"] = mem.available
-        metrics["memory_percent"] = mem.percent
+        if _USE_PROC:
+            mem_total, mem_available = _read_meminfo()
+            metrics["memory_total"] = mem_total
+            metrics["memory_available"] = mem_available
+            metrics["memory_percent"] = round(
+                (mem_total - mem_available) / mem_total * 100, 1
+            )
+        else:
+            mem = psutil.virtual_memory()
+            metrics["memory_total"] = mem.total
+            metrics["memory_available"] = mem.available
+            metrics["memory_percent"] = mem.percent
 
         # Disk metrics for root filesystem
         disk = psutil.disk_usage("/")
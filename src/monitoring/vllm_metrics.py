@@ -1,12 +1,22 @@
 """vLLM metrics collection via HTTP API."""
 
 import logging
+import re
 from typing import Any
 
 import requests
 
 logger = logging.getLogger(__name__)
 
+# Prometheus sample line, split at the first space: "<name>{<labels>} <value>".
+# Comments and blank lines don't match; values with a trailing timestamp fail
+# float() and are skipped.
+_SAMPLE_LINE = re.compile(r"^([^#\s][^ \n]*) (.*)$", re.MULTILINE)
+
+# Shared so the keep-alive connection to /metrics is reused across ticks
+# (calls are sequential, one per collection cycle)
+_SESSION = requests.Session()
+
 
 def get_vllm_metrics(port: int = 8000) -> dict[str, Any]:
     """Get vLLM metrics via HTTP API.
@@ -21,20 +31,15 @@ def get_vllm_metrics(port: int = 8000) -> dict[str, Any]:
     metrics = {}
 
     try:
-        response = requests.get(f"http://localhost:{port}/metrics", timeout=5)
+        response = _SESSION.get(f"http://localhost:{port}/metrics", timeout=5)
         if response.status_code == 200:
-            # Parse Prometheus-style metrics
-            lines = response.text.split("\n")
-            for line in lines:
-                if line.startswith("#") or not line.strip():
+            # Parse Prometheus-style metrics in one regex scan
+            for metric_name, value in _SAMPLE_LINE.findall(response.text):
+                try:
+                    metrics[f"vllm_{metric_name}"] = float(value)
+                except ValueError:
+                    # Skip non-numeric values
                     continue
-                if " " in line:
-                    metric_name, value = line.split(" ", 1)
-                    try:
-                        metrics[f"vllm_{metric_name}"] = float(value)
-                    except ValueError:
-                        # Skip non-numeric values
-                        pass
 
             logger.debug(f"Collected {len(metrics)} vLLM metrics from port {port}")
         else: